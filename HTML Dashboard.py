@@ -9,15 +9,23 @@ Enhanced Isilon Python Script (Multi-Cluster Option, with timeouts & debug print
  - Cluster time & NTP listing
  - Quota usage gracefully handled
  - ADDED: AuditRate function in CLI & Dashboard
- - ADDED: Automatic upload of auditrates.sh to /root/auditrates.sh
+ - ADDED: Automatic upload of auditrates.sh to /root/auditrates.sh (skipped when its SHA-256 matches)
  - NEW: Option to monitor multiple clusters at once, generating a single
         combined HTML with separate sections for each cluster's data
  - ADDED: Timeout in invoke_ssh_command, and debug prints in multi-cluster loop
+ - ADDED: Per-cluster shared SSH connection (SSHPool); dashboard collectors run in parallel
+ - ADDED: On-disk response cache with per-command TTLs (~/.tmp/isilon_cache.sqlite),
+          stale fallback on SSH errors, `--no-cache` flag and menu toggle
+ - ADDED: Multi-cluster mode collects all clusters concurrently (credentials asked up front)
+ - ADDED: `--lazy-load` dashboard (HTML shell + per-panel JSON, published as collected)
+ - ADDED: `--compress` writes/emails the report as .br (brotli installed) or .gz
+ - ADDED: [DEBUG] output goes through the 'onefs' logger; ONEFS_LOG sets the level (default DEBUG)
 
 Edits:
   * `safe_cluster_id(...)` used for HTML IDs.
-  * `invoke_ssh_command(...)` reads line-by-line for 'auditrates.sh' or 'isi_audit_viewer'
-    to stop once "Total average:" is seen, preventing indefinite waits.
+  * `invoke_ssh_command(...)` waits on the channel with select() for 'auditrates.sh' or
+    'isi_audit_viewer' and drains it without blocking until "Total average:" arrives,
+    the channel closes or the timeout passes, preventing indefinite waits.
 ===============================================================================
 """
 
@@ -28,18 +36,43 @@ import getpass
 import paramiko
 import smtplib
 import json
+import gzip
+import time
+import pickle
+import sqlite3
+import shlex
+import hashlib
+import argparse
+import functools
+import logging
+from urllib.parse import quote
 from datetime import datetime
-from typing import List, Dict, Optional
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
-import socket  # ADDED
+from html import escape
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from email.message import EmailMessage
+
+try:
+    import orjson  # optional: several times faster on large quota/NFS/SMB JSON
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # optional: preferred over gzip for --compress when installed
+except ImportError:
+    brotli = None
+import select
+import sys
+import threading
+from contextlib import contextmanager
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 
 ###############################################################################
 # GLOBAL SETTINGS
 ###############################################################################
-SSH_CLIENT = None  # (retained for single-cluster mode)
+logger = logging.getLogger("onefs")  # level from $ONEFS_LOG (default DEBUG), see main()
+SSH_POOLS = {}  # cluster -> SSHPool (one connection per cluster)
+SSH_POOLS_LOCK = threading.Lock()  # cluster threads connect/disconnect concurrently
+_UPLOADED_SCRIPTS = {}  # cluster -> sha256 of the auditrates.sh known to be on it
 SFTEMPFILE = None
 TODAY = datetime.now()
 
@@ -55,6 +88,31 @@ MAIL_FROM = "valentin.vina@XYZ.net"
 MAIL_SUBJECT = f"Isilon Dashboard on {TODAY.strftime('%A')} {TODAY.strftime('%B %d, %Y')} at {TODAY.strftime('%H:%M:%S')}"
 
 SSH_COMMAND_TIMEOUT = 300  # 5 minutes, adjust as you wish
+SSH_MAX_SESSIONS = 8  # concurrent channels per cluster connection (keep below sshd MaxSessions)
+SSH_WINDOW_SIZE = 16 * 1024 * 1024  # per-channel receive window; paramiko's 2 MiB stalls big outputs
+SSH_MAX_PACKET_SIZE = 128 * 1024  # per-channel max packet; fewer, larger packets for paramiko's Python loop (default 32 KiB)
+SSH_COMPRESS = False  # zlib on the transport: fewer bytes on slow WAN links, but extra CPU per packet on a LAN
+SSH_KEEPALIVE = 30  # seconds; keeps the shared connection alive while the menu sits idle
+MULTI_CLUSTER_WORKERS = 4  # clusters collected at once in multi-cluster mode (each runs its own collector pool)
+
+# On-disk response cache for the get_isilon_* helpers (see cached_ssh)
+CACHE_ENABLED = True          # --no-cache / menu option 'C' turns lookups off
+CACHE_STALE_FALLBACK = True   # serve the last good result if the SSH command fails...
+CACHE_STALE_MAX_AGE = 10      # ...as long as it is at most this many TTLs old (marked [STALE since ...])
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".tmp", "isilon_cache.sqlite")
+CACHE_TTL_SHORT = 10    # fast-changing state (isi status, cluster time)
+CACHE_TTL_NORMAL = 60   # battery, read-only, disk, quotas
+CACHE_TTL_LONG = 600    # configuration (NICs, NFS/SMB exports)
+CACHE_TTL_CLUSTER_INFO = 86400  # cluster identity and OneFS version
+CACHE_REFRESH_GROUPS = set()    # cached_ssh groups re-fetched once this run (--refresh-cluster-info)
+_CACHE_REFRESHED = set()
+
+# --lazy-load: write a small HTML shell first, then one JSON file per panel as soon
+# as it is collected; the browser fetches panels when opened (serve over HTTP)
+LAZY_LOAD = False
+
+# --compress: write the report as .br (brotli installed) or .gz and email that file
+COMPRESS_REPORT = False
 
 ###############################################################################
 # TEMP FILE INIT
@@ -71,6 +129,104 @@ def _init_tempfile():
 
 _init_tempfile()
 
+###############################################################################
+# RESPONSE CACHE
+###############################################################################
+def _cache_connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(CACHE_FILE, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ssh_cache ("
+        "key TEXT PRIMARY KEY, ts REAL, stale_at REAL, lines BLOB)"
+    )
+    return conn
+
+def _cache_get(key: str):
+    """
+    Returns (ts, stale_at, value) for a cached entry, or None.
+    """
+    try:
+        conn = _cache_connect()
+        try:
+            row = conn.execute(
+                "SELECT ts, stale_at, lines FROM ssh_cache WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row:
+            return row[0], row[1], pickle.loads(row[2])
+    except Exception as ex:
+        logger.warning("Cache read failed: %s", ex)
+    return None
+
+def _cache_put(key: str, value, ttl: int) -> None:
+    now = time.time()
+    try:
+        conn = _cache_connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ssh_cache (key, ts, stale_at, lines) VALUES (?, ?, ?, ?)",
+                    (key, now, now + ttl, pickle.dumps(value))
+                )
+        finally:
+            conn.close()
+    except Exception as ex:
+        logger.warning("Cache write failed: %s", ex)
+
+STALE_MARKER = "[STALE since "
+
+def _mark_stale(value, ts: float):
+    """
+    Prefix a cached result served after a failed SSH command with a
+    "[STALE since <time>]" line, so the dashboard never shows it as current.
+    Strings (the cluster name baked into auditrates.sh) are returned as they are.
+    """
+    marker = (f"{STALE_MARKER}{datetime.fromtimestamp(ts):%Y-%m-%d %H:%M:%S}] "
+              "SSH command failed; showing the last cached output")
+    if isinstance(value, bytes):
+        return marker.encode() + b"\n" + value
+    if isinstance(value, list):
+        return [marker] + value
+    if isinstance(value, dict):
+        return {k: [marker] + v if isinstance(v, list) else v for k, v in value.items()}
+    return value
+
+def cached_ssh(ttl: int, group: Optional[str] = None):
+    """
+    Cache the result of a get_isilon_* style function (first argument is the
+    cluster name) on disk for `ttl` seconds.
+
+    Results are always refreshed on a miss; with CACHE_ENABLED off the cache is
+    never read, only written. If `group` is in CACHE_REFRESH_GROUPS the first
+    call per key in this run skips the cache. If the wrapped call raises and
+    CACHE_STALE_FALLBACK is set, the last good result is returned instead, marked
+    stale, provided it is at most CACHE_STALE_MAX_AGE * ttl old and the caller did
+    not ask for fresh data (cache off or forced refresh).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(cluster_name: str, *args):
+            key = hashlib.sha256(repr((cluster_name, fn.__name__, args)).encode()).hexdigest()
+            entry = _cache_get(key)
+            force = group in CACHE_REFRESH_GROUPS and key not in _CACHE_REFRESHED
+            if CACHE_ENABLED and not force and entry and entry[1] > time.time():
+                logger.debug("Cache hit: %s for %s", fn.__name__, cluster_name)
+                return entry[2]
+            try:
+                value = fn(cluster_name, *args)
+            except Exception as ex:
+                if (CACHE_STALE_FALLBACK and CACHE_ENABLED and not force and entry
+                        and time.time() - entry[0] <= CACHE_STALE_MAX_AGE * ttl):
+                    logger.warning("%s failed for %s (%s); using last cached result.", fn.__name__, cluster_name, ex)
+                    return _mark_stale(entry[2], entry[0])
+                raise
+            _cache_put(key, value, ttl)
+            if force:
+                _CACHE_REFRESHED.add(key)
+            return value
+        return wrapper
+    return decorator
+
 ###############################################################################
 # ADDED: ALIAS to avoid NameError (dummy function referencing itself).
 ###############################################################################
@@ -84,43 +240,130 @@ def create_html_dashboard_alias(cluster_name: str):
 ###############################################################################
 # SSH HELPER FUNCTIONS
 ###############################################################################
-def connect_isilon_cluster(cluster_name: str, username: str, password: str) -> List[str]:
+class SSHPool:
     """
-    Connect-IsilonCluster equivalent (single cluster).
+    One authenticated SSH connection per cluster, shared by all
+    commands against that cluster. Every command runs on its own channel over
+    the same Transport, so there is a single TCP handshake and login per
+    cluster; a semaphore keeps the number of concurrent channels below the
+    server's MaxSessions limit (OpenSSH default: 10).
     """
-    global SSH_CLIENT
-    try:
-        SSH_CLIENT = paramiko.SSHClient()
-        SSH_CLIENT.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        SSH_CLIENT.connect(
+
+    def __init__(self, cluster_name: str, username: str, password: str, max_sessions: int = SSH_MAX_SESSIONS):
+        self.cluster_name = cluster_name
+        self.username = username
+        self._slots = threading.BoundedSemaphore(max(1, max_sessions))
+        self.client = paramiko.SSHClient()
+        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self.client.connect(
             cluster_name,
             username=username,
             password=password,
             look_for_keys=False,
-            allow_agent=False
+            allow_agent=False,
+            compress=SSH_COMPRESS
         )
-        return [f"Successfully connected to {cluster_name} via SSH."]
+        # The connection lives for the whole session; don't let firewalls/sshd drop it when idle
+        self.client.get_transport().set_keepalive(SSH_KEEPALIVE)
+
+    def is_active(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def _active_transport(self) -> paramiko.Transport:
+        if not self.is_active():
+            raise ValueError(f"SSH session to {self.cluster_name} is no longer active. Reconnect first.")
+        return self.client.get_transport()
+
+    @contextmanager
+    def transport(self):
+        """
+        Borrow one channel slot on the shared Transport.
+        """
+        with self._slots:
+            yield self._active_transport()
+
+    def dedicated_transport(self) -> paramiko.Transport:
+        """
+        Transport for long-running commands (auditrates.sh); their channel does not
+        take one of the collector slots.
+        """
+        return self._active_transport()
+
+    def close(self) -> None:
+        self.client.close()
+
+def get_ssh_pool(cluster_name: str) -> Optional[SSHPool]:
+    with SSH_POOLS_LOCK:
+        return SSH_POOLS.get(cluster_name)
+
+def connect_isilon_cluster(cluster_name: str, username: str, password: str) -> List[str]:
+    """
+    Connect-IsilonCluster equivalent (single cluster).
+    Opens the SSH connection shared by all commands against this cluster.
+    """
+    try:
+        pool = SSHPool(cluster_name, username, password)
     except Exception as e:
         return [f"ERROR: {e}"]
+    with SSH_POOLS_LOCK:
+        old_pool = SSH_POOLS.get(cluster_name)
+        SSH_POOLS[cluster_name] = pool
+    if old_pool:
+        old_pool.close()
+    return [f"Successfully connected to {cluster_name} via SSH."]
+
+def print_connect_result(connect_result: List[str]) -> bool:
+    """
+    Print the output of connect_isilon_cluster(); returns False if it reported an
+    error (checked in the same pass as the printing).
+    """
+    connected = True
+    for line in connect_result:
+        print(line)
+        if connected and "ERROR" in line:
+            connected = False
+    return connected
 
 def disconnect_isilon_cluster(cluster_name: str) -> List[str]:
-    global SSH_CLIENT
-    if SSH_CLIENT:
-        SSH_CLIENT.close()
-        SSH_CLIENT = None
+    with SSH_POOLS_LOCK:
+        pool = SSH_POOLS.pop(cluster_name, None)
+    if pool:
+        pool.close()
         return [f"Disconnected from {cluster_name}"]
     return ["No active SSH session to disconnect."]
 
-def invoke_ssh_command(command: str) -> List[str]:
+def run_cluster_command(cluster_name: str, command: str) -> List[str]:
+    """
+    Run a command on its own channel of the cluster's shared SSH connection.
+    """
+    pool = get_ssh_pool(cluster_name)
+    if not pool:
+        raise ValueError("SSH session not established. Connect first.")
+    with pool.transport() as transport:
+        return invoke_ssh_command(command, transport)
+
+def run_cluster_command_raw(cluster_name: str, command: str) -> bytes:
+    """
+    Same as run_cluster_command, but the output comes back as undecoded bytes.
+    """
+    pool = get_ssh_pool(cluster_name)
+    if not pool:
+        raise ValueError("SSH session not established. Connect first.")
+    with pool.transport() as transport:
+        return invoke_ssh_command_raw(command, transport)
+
+def invoke_ssh_command(command: str, transport: paramiko.Transport) -> List[str]:
     """
-    Run a command with a specified timeout (SSH_COMMAND_TIMEOUT) to avoid indefinite hangs.
+    Run a command on a new channel of the given transport with a specified timeout
+    (SSH_COMMAND_TIMEOUT) to avoid indefinite hangs.
 
-    If the command includes 'auditrates.sh' or 'isi_audit_viewer', we do a line-by-line read
-    until we see "Total average:" or the channel closes, preventing indefinite block
-    once the script has effectively ended.
+    If the command includes 'auditrates.sh' or 'isi_audit_viewer', we wait on the channel
+    with select() and drain it until a line with "Total average:" arrives, the channel
+    closes or the timeout passes, preventing indefinite block once the script has
+    effectively ended.
     """
-    global SSH_CLIENT
-    if not SSH_CLIENT:
+    if not transport:
         raise ValueError("SSH session not established. Connect first.")
 
     # By default
@@ -128,60 +371,116 @@ def invoke_ssh_command(command: str) -> List[str]:
 
     # Potentially long
     if "auditrates.sh" in command or "isi_audit_viewer" in command:
-        print("[DEBUG] Detected a potentially long-running command. Increasing local timeout to 3600 seconds.")
+        logger.debug("Detected a potentially long-running command. Increasing local timeout to 3600 seconds.")
         local_timeout = 3600
 
-    # Execute once
-    stdin, stdout, stderr = SSH_CLIENT.exec_command(command, timeout=local_timeout)
+    # Execute once, on a fresh channel of the shared transport
+    channel = transport.open_session(window_size=SSH_WINDOW_SIZE, max_packet_size=SSH_MAX_PACKET_SIZE)
+    try:
+        channel.settimeout(local_timeout)
+        channel.exec_command(command)
+        return _read_channel(channel, command, local_timeout)
+    finally:
+        channel.close()
+
+def invoke_ssh_command_raw(command: str, transport: paramiko.Transport) -> bytes:
+    """
+    Run a short command like invoke_ssh_command and return its stdout as one bytes
+    object, skipping the decode + splitlines. Used for the `--format json` reports,
+    whose bytes go straight to the JSON parser: stderr is only returned when there
+    is no stdout (so the error shows up in the panel), never mixed into the JSON.
+    """
+    if not transport:
+        raise ValueError("SSH session not established. Connect first.")
+
+    channel = transport.open_session(window_size=SSH_WINDOW_SIZE, max_packet_size=SSH_MAX_PACKET_SIZE)
+    try:
+        channel.settimeout(SSH_COMMAND_TIMEOUT)
+        channel.exec_command(command)
+        out, err = _read_channel_streams(channel)
+    finally:
+        channel.close()
+    if not out.strip():
+        return err
+    if err and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("stderr of '%s': %s", command, err.decode(errors="replace").strip())
+    return out
+
+def _read_channel_streams(channel: paramiko.Channel) -> Tuple[bytes, bytes]:
+    out = b"".join(iter(lambda: channel.recv(65536), b""))
+    err = b"".join(iter(lambda: channel.recv_stderr(65536), b""))
+    return out, err
+
+def _read_channel(channel: paramiko.Channel, command: str, timeout: float) -> List[str]:
+    """
+    Collect stdout + stderr lines of a channel that is already executing `command`.
+    """
     # If command is normal, just read the standard out
     if not ("auditrates.sh" in command or "isi_audit_viewer" in command):
-        out = stdout.read().decode(errors="replace").splitlines()
-        err = stderr.read().decode(errors="replace").splitlines()
-        return out + err
+        out, err = _read_channel_streams(channel)
+        return out.decode(errors="replace").splitlines() + err.decode(errors="replace").splitlines()
 
     # Otherwise, for 'auditrates.sh' or 'isi_audit_viewer':
-    # We'll read line-by-line to detect "Total average:".
+    # Wait in select() until the channel has data, drain whatever is buffered
+    # without blocking, and scan complete lines for "Total average:".
     out_lines = []
     err_lines = []
-    channel = stdout.channel
-    done_keywords = ["Total average:"]  # If we see that, we consider the script finished.
+    done_marker = b"Total average:"  # If we see that, we consider the script finished.
 
-    channel.settimeout(5.0)
-    # Keep reading lines until exit_status_ready or we see done_keywords
-    found_done = False
+    buf = bytearray()
+    err_buf = bytearray()
+    deadline = time.monotonic() + timeout
+    channel.setblocking(False)
     try:
         while True:
-            if channel.exit_status_ready():
-                # remote side has closed
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                out_lines.append(f"[WARN] No end marker after {timeout}s, giving up on remaining output.")
                 break
-            try:
-                line = stdout.readline()
-            except socket.timeout:
-                # If no data for 5s
-                if channel.exit_status_ready():
-                    break
-                continue  # else keep reading
-            if not line:
-                # Possibly no more data right now
+            readable, _, _ = select.select([channel], [], [], min(30.0, remaining))
+            if not readable:
                 if channel.exit_status_ready():
                     break
                 continue
-            # We got a line
-            line_strip = line.rstrip("\r\n")
-            out_lines.append(line_strip)
-            # If "Total average:" is found, we consider it ended
-            for kw in done_keywords:
-                if kw in line_strip:
+
+            # Drain exactly what is buffered right now (stderr too, so it can't stall the window)
+            while channel.recv_stderr_ready():
+                err_buf += channel.recv_stderr(65536)
+            found_done = False
+            while channel.recv_ready():
+                buf += channel.recv(65536)
+                # Keep the unterminated tail in the buffer for the next chunk
+                *complete, tail = buf.split(b"\n")
+                buf = bytearray(tail)
+                out_lines.extend(ln.rstrip(b"\r").decode(errors="replace") for ln in complete)
+                if any(done_marker in ln for ln in complete):
                     found_done = True
                     break
             if found_done:
                 break
+            if channel.eof_received or channel.exit_status_ready():
+                # Remote side has closed and everything buffered was read
+                if not channel.recv_ready():
+                    break
     except Exception as ex:
         # We'll store a warning but not remove other lines
         out_lines.append(f"[WARN] {str(ex)}")
-
-    # Also read any remainder from stderr
-    err_data = stderr.read().decode(errors="replace")
+    finally:
+        channel.settimeout(timeout)
+    if buf:
+        out_lines.append(buf.rstrip(b"\r").decode(errors="replace"))
+
+    # Also read any remainder from stderr, without ever blocking on it: after the
+    # marker the channel may still be open, so give it at most one second
+    drain_until = time.monotonic() + 1.0
+    while time.monotonic() < drain_until:
+        if channel.recv_stderr_ready():
+            err_buf += channel.recv_stderr(65536)
+        elif channel.eof_received or channel.exit_status_ready():
+            break
+        else:
+            time.sleep(0.05)
+    err_data = err_buf.decode(errors="replace")
     if err_data:
         err_lines.extend(err_data.splitlines())
 
@@ -190,13 +489,11 @@ def invoke_ssh_command(command: str) -> List[str]:
 ###############################################################################
 # (NEW) Upload the Audit Rate script to /root/auditrates.sh
 ###############################################################################
-def upload_audit_rate_script() -> None:
-    global SSH_CLIENT
-
+def upload_audit_rate_script(cluster_name: str) -> None:
     script_content = """#!/bin/bash
 
-# Obtain the cluster name, trim whitespace, convert to lowercase
-CLUSTER_NAME=$(isi cluster identity view | grep 'Name:' | cut -d: -f2 | awk '{gsub(/[[:space:]]+/, ""); print tolower($0)}')
+# Cluster name (trimmed, lowercase)
+@CLUSTER_NAME_LINE@
 
 # Generate DATE1 and DATE2 for the last 24 hours
 DATE1=$(date -v-24H "+%Y-%m-%d %H:%M:%S") # 24 hours ago
@@ -214,81 +511,133 @@ DIFF=$(expr $EPOCH2 - $EPOCH1)
 
 isi status -q
 
-declare -a event_array
-
-for node in $(isi_for_array hostname | cut -d: -f1 | sed 's/^.*-\\([0-9]*\\)$/\\1/' | sort -n)
-do
-  echo -e "node $node:\\t"
-  echo -e "Results $(date) \\nnode $node:\\t" >> "$SAVE_FILE"
-  EVENTS=$(isi_audit_viewer -n $node -t protocol -s "$DATE1" -e "$DATE2" | wc -l)
-  echo "Seconds: $DIFF"
-  echo "Events: $EVENTS"
-  event_array+=($EVENTS)
-  echo "Average rate: $(perl -E "say $EVENTS / $DIFF") evts/s"
-  echo "Average rate: $(perl -E "say $EVENTS / $DIFF") evts/s" >> "$SAVE_FILE"
-done
-
-TOTAL=0
-
-for EVENT in ${event_array[@]}; do
-  TOTAL=$(expr $TOTAL + $EVENT)
-done
-
-echo "Total average: $(perl -E "say $TOTAL / $DIFF") evts/s"
-echo "Total average: $(perl -E "say $TOTAL / $DIFF") evts/s" >> "$SAVE_FILE"
+NODES=$(isi_for_array hostname | cut -d: -f1 | sed 's/^.*-\\([0-9]*\\)$/\\1/' | sort -n)
+NODE_COUNT=$(echo "$NODES" | wc -w)
+
+# Scan every node's audit log at the same time; each line is "<node> <events>".
+# grep -c '^' also counts an unterminated last line and prints no padding, unlike BSD wc -l
+COUNTS=$(echo "$NODES" | xargs -P "$NODE_COUNT" -I{} sh -c \\
+  'echo "{} $(isi_audit_viewer -n {} -t protocol -s "$1" -e "$2" | grep -c "^")"' _ "$DATE1" "$DATE2" | sort -n)
+
+# Per-node and total rates in a single awk pass
+echo "$COUNTS" | awk -v d="$DIFF" -v f="$SAVE_FILE" -v now="$(date)" '
+NF == 2 {
+  printf "node %s:\\t\\nSeconds: %s\\nEvents: %s\\nAverage rate: %s evts/s\\n", $1, d, $2, $2 / d
+  printf "Results %s \\nnode %s:\\t\\nAverage rate: %s evts/s\\n", now, $1, $2 / d >> f
+  t += $2
+}
+END {
+  printf "Total average: %s evts/s\\n", t / d
+  printf "Total average: %s evts/s\\n", t / d >> f
+}'
 """
 
-    if not SSH_CLIENT:
+    pool = get_ssh_pool(cluster_name)
+    if not pool:
         print("No SSH connection to upload script. Connect first.")
         return
 
-    sftp = SSH_CLIENT.open_sftp()
+    # The identity is cached for a day, so the script does not have to look it up on every run
     try:
-        remote_path = "/root/auditrates.sh"
-        with sftp.open(remote_path, 'w') as f:
-            f.write(script_content)
-        sftp.chmod(remote_path, 0o755)
-    finally:
-        sftp.close()
+        identity_name = get_isilon_cluster_name(cluster_name)
+    except Exception as ex:
+        logger.debug("Could not read cluster identity for %s: %s", cluster_name, ex)
+        identity_name = ""
+    if identity_name:
+        cluster_name_line = f"CLUSTER_NAME={shlex.quote(identity_name)}"
+    else:
+        cluster_name_line = (
+            "CLUSTER_NAME=$(isi cluster identity view | grep 'Name:' | cut -d: -f2"
+            " | awk '{gsub(/[[:space:]]+/, \"\"); print tolower($0)}')"
+        )
+    script_content = script_content.replace("@CLUSTER_NAME_LINE@", cluster_name_line)
+
+    # Skip the SFTP round trip when the cluster already has this exact script
+    remote_path = "/root/auditrates.sh"
+    local_hash = hashlib.sha256(script_content.encode()).hexdigest()
+    if _UPLOADED_SCRIPTS.get(cluster_name) == local_hash:
+        return
+    try:
+        remote_out = run_cluster_command(cluster_name, f"sha256 -q {remote_path} 2>/dev/null")
+        remote_hash = remote_out[0].strip() if remote_out else ""
+    except Exception as ex:
+        logger.debug("Could not hash %s on %s: %s", remote_path, cluster_name, ex)
+        remote_hash = ""
+    if remote_hash == local_hash:
+        logger.debug("%s on %s is up to date, not uploading", remote_path, cluster_name)
+        _UPLOADED_SCRIPTS[cluster_name] = local_hash
+        return
+
+    with pool.transport() as transport:
+        sftp = paramiko.SFTPClient.from_transport(transport)
+        try:
+            with sftp.open(remote_path, 'w') as f:
+                f.write(script_content)
+            sftp.chmod(remote_path, 0o755)
+        finally:
+            sftp.close()
+    _UPLOADED_SCRIPTS[cluster_name] = local_hash
 
 ###############################################################################
 # BASIC GET-ISILON-X
 ###############################################################################
+@cached_ssh(ttl=CACHE_TTL_SHORT)
 def get_isilon_status(cluster_name: str) -> List[str]:
     cmd = "isi status"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
 
+@cached_ssh(ttl=CACHE_TTL_NORMAL)
 def get_isilon_battery_status(cluster_name: str) -> List[str]:
     cmd = "isi batterystatus list"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
 
+@cached_ssh(ttl=CACHE_TTL_NORMAL)
 def get_isilon_read_write_status(cluster_name: str) -> List[str]:
     cmd = "isi readonly list"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
 
+@cached_ssh(ttl=CACHE_TTL_NORMAL)
 def get_isilon_disk_usage(cluster_name: str) -> List[str]:
     cmd = "isi_for_array -s df -ik | grep -v 1024-blocks"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
 
+@cached_ssh(ttl=CACHE_TTL_LONG)
 def get_isilon_nics(cluster_name: str) -> List[str]:
     cmd = "isi network interfaces list"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
 
+@cached_ssh(ttl=CACHE_TTL_CLUSTER_INFO, group="cluster_info")
 def get_isilon_version(cluster_name: str) -> List[str]:
     cmd = "isi version"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
+
+@cached_ssh(ttl=CACHE_TTL_CLUSTER_INFO, group="cluster_info")
+def get_isilon_cluster_name(cluster_name: str) -> str:
+    """
+    Cluster name from `isi cluster identity view`, trimmed and lowercased
+    (as used in the auditrates_<name>_<timestamp>.txt file names).
+    """
+    for line in run_cluster_command(cluster_name, "isi cluster identity view"):
+        if "Name:" in line:
+            return "".join(line.split(":", 1)[1].split()).lower()
+    return ""
 
 ###############################################################################
 # (NEW) GET CLUSTER TIME + NTP
 ###############################################################################
+@cached_ssh(ttl=CACHE_TTL_SHORT)
 def get_isilon_time_and_ntp(cluster_name: str) -> Dict[str, List[str]]:
-    print(f"[DEBUG] Gathering cluster time for {cluster_name} ...")
-    time_cmd = "isi_for_array -s date"
-    time_out = invoke_ssh_command(time_cmd)
-
-    print(f"[DEBUG] Gathering NTP servers for {cluster_name} ...")
-    ntp_cmd = "isi ntp servers list"
-    ntp_out = invoke_ssh_command(ntp_cmd)
+    logger.debug("Gathering cluster time and NTP servers for %s ...", cluster_name)
+    # One round trip: both commands in a single exec, split locally on a sentinel line
+    sentinel = "___ISILON_NTP_SERVERS___"
+    cmd = f"isi_for_array -s date; echo {sentinel}; isi ntp servers list"
+    out = run_cluster_command(cluster_name, cmd)
+
+    if sentinel in out:
+        split_at = out.index(sentinel)
+        time_out, ntp_out = out[:split_at], out[split_at + 1:]
+    else:
+        time_out, ntp_out = out, []
 
     return {
         "cluster_time": time_out,
@@ -300,39 +649,46 @@ def get_isilon_time_and_ntp(cluster_name: str) -> Dict[str, List[str]]:
 ###############################################################################
 def set_isilon_sync_time_with_domain(cluster_name: str, domain: str) -> List[str]:
     cmd = f"isi_for_array -s isi_classic auth ads time --sync --domain={domain} --force"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command(cluster_name, cmd)
 
 ###############################################################################
 # (2) QUOTA USAGE REPORT
 ###############################################################################
-def get_quota_usage_report(cluster_name: str) -> List[str]:
-    print(f"[DEBUG] Gathering Quota Usage for {cluster_name} ...")
+@cached_ssh(ttl=CACHE_TTL_NORMAL)
+def get_quota_usage_report(cluster_name: str) -> bytes:
+    logger.debug("Gathering Quota Usage for %s ...", cluster_name)
     cmd = "isi quota quotas list --format json"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command_raw(cluster_name, cmd)
 
 ###############################################################################
 # (3) NFS REPORT
 ###############################################################################
-def get_isilon_nfs_report(cluster_name: str) -> List[str]:
-    print(f"[DEBUG] Gathering NFS Exports for {cluster_name} ...")
+@cached_ssh(ttl=CACHE_TTL_LONG)
+def get_isilon_nfs_report(cluster_name: str) -> bytes:
+    logger.debug("Gathering NFS Exports for %s ...", cluster_name)
     cmd = "isi nfs exports list --format json"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command_raw(cluster_name, cmd)
 
 ###############################################################################
 # (4) SMB REPORT
 ###############################################################################
-def get_isilon_smb_report(cluster_name: str) -> List[str]:
-    print(f"[DEBUG] Gathering SMB Shares for {cluster_name} ...")
+@cached_ssh(ttl=CACHE_TTL_LONG)
+def get_isilon_smb_report(cluster_name: str) -> bytes:
+    logger.debug("Gathering SMB Shares for %s ...", cluster_name)
     cmd = "isi smb share list --format json"
-    return invoke_ssh_command(cmd)
+    return run_cluster_command_raw(cluster_name, cmd)
 
 ###############################################################################
 # (NEW) AUDIT RATE
 ###############################################################################
 def run_isilon_audit_rate(cluster_name: str) -> List[str]:
-    print(f"[DEBUG] Running AuditRate script for {cluster_name} ...")
+    logger.debug("Running AuditRate script for %s ...", cluster_name)
     script_cmd = "bash /root/auditrates.sh"
-    return invoke_ssh_command(script_cmd)
+    pool = get_ssh_pool(cluster_name)
+    if not pool:
+        raise ValueError("SSH session not established. Connect first.")
+    # Own channel outside the collector slots, so the long audit run never blocks them
+    return invoke_ssh_command(script_cmd, pool.dedicated_transport())
 
 ###############################################################################
 # MENU
@@ -350,11 +706,13 @@ def print_menu():
     print("9)  NFS Report                   (isi nfs exports list)")
     print("10) SMB Report                  (isi smb share list)")
     print("11) Audit Rate                   (Runs AuditRate script)")
+    print(f"C)  Toggle response cache       (currently {'ON' if CACHE_ENABLED else 'OFF, same as --no-cache'})")
     print("D)  Disconnect from cluster")
     print("X/Q) Quit (same as exit)")
     print("==============================================")
 
 def menu_loop(cluster_name: str):
+    global CACHE_ENABLED
     while True:
         print_menu()
         choice = input("Choose an option: ").strip().lower()
@@ -404,8 +762,7 @@ def menu_loop(cluster_name: str):
             if not out:
                 print("No quotas found.")
             else:
-                for line in out:
-                    print(line)
+                print(out.decode(errors="replace"))
 
         elif choice == "9":
             out = get_isilon_nfs_report(cluster_name)
@@ -413,8 +770,7 @@ def menu_loop(cluster_name: str):
             if not out:
                 print("No NFS exports found.")
             else:
-                for line in out:
-                    print(line)
+                print(out.decode(errors="replace"))
 
         elif choice == "10":
             out = get_isilon_smb_report(cluster_name)
@@ -422,16 +778,19 @@ def menu_loop(cluster_name: str):
             if not out:
                 print("No SMB shares found.")
             else:
-                for line in out:
-                    print(line)
+                print(out.decode(errors="replace"))
 
         elif choice == "11":
             print("\n-- Attempting to upload script and run Audit Rate --")
-            upload_audit_rate_script()
+            upload_audit_rate_script(cluster_name)
             out = run_isilon_audit_rate(cluster_name)
             for line in out:
                 print(line)
 
+        elif choice == "c":
+            CACHE_ENABLED = not CACHE_ENABLED
+            print(f"Response cache {'enabled' if CACHE_ENABLED else 'disabled, every command queries the cluster'}.")
+
         elif choice == "d":
             disc = disconnect_isilon_cluster(cluster_name)
             print("\n".join(disc))
@@ -446,118 +805,138 @@ def menu_loop(cluster_name: str):
 ###############################################################################
 # HTML HELPERS: Generating Table from JSON
 ###############################################################################
-def generate_nfs_html_table(json_str: str) -> str:
+def parse_json_output(data: Union[str, bytes]):
+    """
+    Parse `isi ... --format json` output (str or raw bytes) with orjson when it is
+    installed, stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _with_stale_note(render: Callable[[Union[str, bytes]], str]) -> Callable[[Union[str, bytes]], str]:
+    """
+    Let a JSON table renderer accept output marked by _mark_stale(): the marker
+    line is shown as a warning above the table instead of breaking the parse.
+    """
+    @functools.wraps(render)
+    def wrapper(json_str: Union[str, bytes]) -> str:
+        marker = STALE_MARKER.encode() if isinstance(json_str, bytes) else STALE_MARKER
+        if not json_str.startswith(marker):
+            return render(json_str)
+        note, _, json_str = json_str.partition(b"\n" if isinstance(json_str, bytes) else "\n")
+        if isinstance(note, bytes):
+            note = note.decode(errors="replace")
+        return f"<p class='text-warning'>{escape(note)}</p>" + render(json_str or "[]")
+    return wrapper
+
+def _json_error_html(label: str, data: Union[str, bytes]) -> str:
+    if isinstance(data, bytes):
+        data = data.decode(errors="replace")
+    return f"<p>ERROR parsing {label} JSON.</p><pre>{escape(data)}</pre>"
+
+def html_table(headers: List[str], rows: Iterator[List[str]]) -> str:
+    """
+    Bootstrap table from header labels and rows of cell HTML (already escaped).
+    Each row is joined in one go instead of appending every <td> separately.
+    """
+    head = "".join(f"<th>{h}</th>" for h in headers)
+    body = "\n".join("<tr><td>" + "</td><td>".join(row) + "</td></tr>" for row in rows)
+    return (
+        f"<table class='table table-bordered table-sm'><thead><tr>{head}</tr></thead><tbody>\n"
+        f"{body}\n</tbody></table>"
+    )
+
+def cell(value) -> str:
+    return escape(str(value))
+
+def cell_list(values) -> str:
+    return "<br>".join(escape(str(v)) for v in values) if values else ""
+
+def _fmt_smb_perms(perms) -> str:
+    if not perms:
+        return "None"
+    return "<br>".join(
+        escape(f"{p.get('permission', '')}({p.get('permission_type', '')}) => {p.get('trustee', {}).get('id', '')}")
+        for p in perms
+    )
+
+@_with_stale_note
+def generate_nfs_html_table(json_str: Union[str, bytes]) -> str:
     try:
-        exports = json.loads(json_str)
+        exports = parse_json_output(json_str)
     except Exception:
-        return f"<p>ERROR parsing NFS JSON.</p><pre>{json_str}</pre>"
+        return _json_error_html("NFS", json_str)
 
     if not exports:
         return "<p>No NFS Exports Found.</p>"
 
-    lines = []
-    lines.append("<table class='table table-bordered table-sm'><thead><tr>")
-    lines.append("<th>ID</th><th>Description</th><th>Paths</th><th>Read_Only?</th><th>ReadWrite Clients</th><th>Root Clients</th>")
-    lines.append("</tr></thead><tbody>")
-
-    for exp in exports:
-        exp_id = exp.get("id", "")
-        desc   = exp.get("description", "")
-        paths  = exp.get("paths", [])
-        ro     = str(exp.get("read_only", False))
-        rwc    = exp.get("read_write_clients", [])
-        rc     = exp.get("root_clients", [])
-
-        paths_str = "<br>".join(paths) if paths else ""
-        rwc_str   = "<br>".join(rwc) if rwc else ""
-        rc_str    = "<br>".join(rc) if rc else ""
-
-        lines.append("<tr>")
-        lines.append(f"<td>{exp_id}</td>")
-        lines.append(f"<td>{desc}</td>")
-        lines.append(f"<td>{paths_str}</td>")
-        lines.append(f"<td>{ro}</td>")
-        lines.append(f"<td>{rwc_str}</td>")
-        lines.append(f"<td>{rc_str}</td>")
-        lines.append("</tr>")
-
-    lines.append("</tbody></table>")
-    return "\n".join(lines)
-
-def generate_smb_html_table(json_str: str) -> str:
+    return html_table(
+        ["ID", "Description", "Paths", "Read_Only?", "ReadWrite Clients", "Root Clients"],
+        (
+            [
+                cell(exp.get("id", "")),
+                cell(exp.get("description", "")),
+                cell_list(exp.get("paths", [])),
+                cell(exp.get("read_only", False)),
+                cell_list(exp.get("read_write_clients", [])),
+                cell_list(exp.get("root_clients", [])),
+            ]
+            for exp in exports
+        )
+    )
+
+@_with_stale_note
+def generate_smb_html_table(json_str: Union[str, bytes]) -> str:
     try:
-        shares = json.loads(json_str)
+        shares = parse_json_output(json_str)
     except Exception:
-        return f"<p>ERROR parsing SMB JSON.</p><pre>{json_str}</pre>"
+        return _json_error_html("SMB", json_str)
 
     if not shares:
         return "<p>No SMB Shares Found.</p>"
 
-    lines = []
-    lines.append("<table class='table table-bordered table-sm'><thead><tr>")
-    lines.append("<th>ID</th><th>Name</th><th>Path</th><th>Description</th><th>Browsable?</th><th>Permissions</th>")
-    lines.append("</tr></thead><tbody>")
-
-    for share in shares:
-        sid   = share.get("id", "")
-        name  = share.get("name", "")
-        path  = share.get("path", "")
-        desc  = share.get("description", "")
-        brow  = str(share.get("browsable", False))
-
-        perms = share.get("permissions", [])
-        perms_str = []
-        for p in perms:
-            pmode = p.get("permission", "")
-            ptyp  = p.get("permission_type", "")
-            trustee = p.get("trustee", {}).get("id","")
-            perms_str.append(f"{pmode}({ptyp}) => {trustee}")
-        perms_final = "<br>".join(perms_str) if perms_str else "None"
-
-        lines.append("<tr>")
-        lines.append(f"<td>{sid}</td>")
-        lines.append(f"<td>{name}</td>")
-        lines.append(f"<td>{path}</td>")
-        lines.append(f"<td>{desc}</td>")
-        lines.append(f"<td>{brow}</td>")
-        lines.append(f"<td>{perms_final}</td>")
-        lines.append("</tr>")
-
-    lines.append("</tbody></table>")
-    return "\n".join(lines)
-
-def generate_quota_html_table(json_str: str) -> str:
+    return html_table(
+        ["ID", "Name", "Path", "Description", "Browsable?", "Permissions"],
+        (
+            [
+                cell(share.get("id", "")),
+                cell(share.get("name", "")),
+                cell(share.get("path", "")),
+                cell(share.get("description", "")),
+                cell(share.get("browsable", False)),
+                _fmt_smb_perms(share.get("permissions", [])),
+            ]
+            for share in shares
+        )
+    )
+
+@_with_stale_note
+def generate_quota_html_table(json_str: Union[str, bytes]) -> str:
     try:
-        quotas = json.loads(json_str)
+        quotas = parse_json_output(json_str)
     except Exception:
-        return f"<p>ERROR parsing Quota JSON.</p><pre>{json_str}</pre>"
+        return _json_error_html("Quota", json_str)
 
     if not quotas:
         return "<p>No quotas found.</p>"
 
-    lines = []
-    lines.append("<table class='table table-bordered table-sm'><thead><tr>")
-    lines.append("<th>Type</th><th>Path</th><th>Hard Threshold</th><th>Usage Derived</th>")
-    lines.append("</tr></thead><tbody>")
-
-    for q in quotas:
-        q_type = q.get("type", "")
-        path   = q.get("path", "")
-        thresh = ""
-        if "thresholds" in q:
-            hard_val = q["thresholds"].get("hard", None)
-            thresh   = str(hard_val) if hard_val else ""
-        usage  = q.get("usage_derived", 0)
-
-        lines.append("<tr>")
-        lines.append(f"<td>{q_type}</td>")
-        lines.append(f"<td>{path}</td>")
-        lines.append(f"<td>{thresh}</td>")
-        lines.append(f"<td>{usage}</td>")
-        lines.append("</tr>")
-
-    lines.append("</tbody></table>")
-    return "\n".join(lines)
+    def hard_threshold(q) -> str:
+        hard_val = (q.get("thresholds") or {}).get("hard", None)
+        return str(hard_val) if hard_val else ""
+
+    return html_table(
+        ["Type", "Path", "Hard Threshold", "Usage Derived"],
+        (
+            [
+                cell(q.get("type", "")),
+                cell(q.get("path", "")),
+                cell(hard_threshold(q)),
+                cell(q.get("usage_derived", 0)),
+            ]
+            for q in quotas
+        )
+    )
 
 BOOTSTRAP_CSS = """
 <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/css/bootstrap.min.css" rel="stylesheet">
@@ -567,76 +946,441 @@ BOOTSTRAP_JS = """
 <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/js/bootstrap.bundle.min.js"></script>
 """
 
+# Loader for --lazy-load dashboards. Polls the manifest for finished panels and
+# fills a panel body from its data-src JSON once it is both ready and opened
+# ({"lines": [...]} is shown as <pre>, {"html": "..."} is inserted as-is).
+LAZY_LOADER_JS = """
+<script>
+const readySrc = new Set();
+let collectionDone = false;
+let preloadAll = false;
+
+function loadSection(body) {
+  if (body.dataset.loaded) return;
+  if (!readySrc.has(body.dataset.src)) {
+    if (collectionDone) body.textContent = "No data was collected for this panel.";
+    return;
+  }
+  body.dataset.loaded = "1";
+  fetch(body.dataset.src)
+    .then(r => r.json())
+    .then(d => {
+      if (d.lines !== undefined) {
+        const pre = document.createElement("pre");
+        pre.textContent = d.lines.length ? d.lines.join("\\n") : (d.empty || "");
+        body.replaceChildren(pre);
+      } else {
+        body.innerHTML = d.html;
+      }
+    })
+    .catch(e => {
+      body.dataset.loaded = "";
+      body.textContent = "Could not load " + body.dataset.src + " (" + e + ")";
+    });
+}
+function refreshSections() {
+  document.querySelectorAll("[data-src]").forEach(body => {
+    if (preloadAll || body.closest(".collapse:not(.show)") === null) loadSection(body);
+  });
+}
+function pollManifest() {
+  fetch(document.body.dataset.manifest, {cache: "no-store"})
+    .then(r => r.ok ? r.text() : "")
+    .then(text => {
+      text.split("\\n").filter(Boolean).forEach(line => {
+        const entry = JSON.parse(line);
+        if (entry.done) collectionDone = true;
+        else readySrc.add(entry.src);
+      });
+      refreshSections();
+      if (!collectionDone) setTimeout(pollManifest, 2000);
+    })
+    .catch(() => setTimeout(pollManifest, 2000));
+}
+document.addEventListener("shown.bs.collapse", refreshSections);
+document.addEventListener("DOMContentLoaded", () => {
+  document.getElementById("preloadAll").addEventListener("click", () => {
+    preloadAll = true;
+    refreshSections();
+  });
+  pollManifest();
+});
+</script>
+"""
+
+# Constant pieces of one accordion panel; _emit_panel only adds the ids, title and
+# body between them. Pieces that depend on the open/closed state are (collapsed, expanded).
+_ACC_HEAD1 = '\n<div class="accordion-item">\n  <h2 class="accordion-header" id="heading'
+_ACC_HEAD2 = (
+    '">\n    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapse',
+    '">\n    <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#collapse',
+)
+_ACC_HEAD3 = ('" aria-expanded="false" aria-controls="collapse', '" aria-expanded="true" aria-controls="collapse')
+_ACC_HEAD4 = '">\n      '
+_ACC_HEAD5 = '\n    </button>\n  </h2>\n  <div id="collapse'
+_ACC_HEAD6 = ('" class="accordion-collapse collapse" aria-labelledby="heading',
+              '" class="accordion-collapse collapse show" aria-labelledby="heading')
+_ACC_HEAD7 = '" data-bs-parent="#accordionExample">\n    <div class="accordion-body">\n'
+_ACC_TAIL = '\n</div></div></div>'
+
+def _emit_panel(lines: List[str], panel_id: str, cluster_id: str, title: str,
+                body_html: str, expanded: bool = False) -> None:
+    """
+    Append one accordion panel to `lines` as constant pieces plus the few variable
+    ones, instead of formatting a fresh multi-line string per panel.
+    """
+    pid = panel_id + "_" + cluster_id
+    lines.extend((
+        _ACC_HEAD1, pid,
+        _ACC_HEAD2[expanded], pid,
+        _ACC_HEAD3[expanded], pid,
+        _ACC_HEAD4, title,
+        _ACC_HEAD5, pid,
+        _ACC_HEAD6[expanded], pid,
+        _ACC_HEAD7, body_html,
+        _ACC_TAIL,
+    ))
+
+def accordion_section(cluster_id: str, key: str, title: str, body: str, expanded: bool = False) -> str:
+    lines = []
+    _emit_panel(lines, key, cluster_id, title, body, expanded)
+    return "".join(lines)
+
+def pre_block(lines: List[str], empty: str = "") -> str:
+    """
+    Raw command output as one escaped <pre> block.
+    """
+    return "<pre>" + escape("\n".join(lines) if lines else empty) + "</pre>"
+
+def time_ntp_body(cluster_time_lines: List[str], ntp_lines: List[str]) -> str:
+    return (
+        "<h5>Cluster Time (isi_for_array -s date)</h5>"
+        + pre_block(cluster_time_lines, "No cluster time data.")
+        + "\n<h5>NTP Servers (isi ntp servers list)</h5>"
+        + pre_block(ntp_lines, "No NTP data.")
+    )
+
+def json_text(out: Union[bytes, List[str]]) -> Union[bytes, str]:
+    """
+    JSON report as handed to parse_json_output: raw bytes pass through untouched,
+    line lists (error placeholders, older cache entries) are joined.
+    """
+    if isinstance(out, bytes):
+        return out or b"[]"
+    return "\n".join(out) if out else "[]"
+
+_ID_RE = re.compile(r'[^A-Za-z0-9_-]+')
+
+@functools.lru_cache(maxsize=256)
 def safe_cluster_id(cluster_name: str) -> str:
     """
     Replaces invalid ID chars (like dots) with underscores for accordion IDs.
     Example: '10.154.0.71' -> '10_154_0_71'
     """
-    return re.sub(r'[^A-Za-z0-9_-]+', '_', cluster_name)
+    return _ID_RE.sub('_', cluster_name)
 
-def create_html_dashboard(cluster_name: str):
-    if not SSH_CLIENT:
-        print("No SSH session. Please connect first.")
-        return
+def collect_cluster_data(
+    cluster_name: str,
+    on_result: Optional[Callable[[str, str, object], None]] = None
+) -> Dict[str, object]:
+    """
+    Run the independent dashboard collectors side by side on the cluster's SSH
+    connection and return their output keyed by section. The audit rate runs on
+    a dedicated channel, so it only costs one extra worker.
 
-    upload_audit_rate_script()
-
-    print(f"[DEBUG] Gathering cluster time/NTP for cluster: {cluster_name}")
-    time_data = get_isilon_time_and_ntp(cluster_name)
-    cluster_time_lines = time_data["cluster_time"]
-    ntp_lines = time_data["ntp_info"]
-
-    print(f"[DEBUG] Gathering status for cluster: {cluster_name}")
-    status_data   = get_isilon_status(cluster_name)
-    print(f"[DEBUG] Gathering battery for cluster: {cluster_name}")
-    battery_data  = get_isilon_battery_status(cluster_name)
-    print(f"[DEBUG] Gathering read/write for cluster: {cluster_name}")
-    rw_data       = get_isilon_read_write_status(cluster_name)
-    print(f"[DEBUG] Gathering disk usage for cluster: {cluster_name}")
-    disk_data     = get_isilon_disk_usage(cluster_name)
-    print(f"[DEBUG] Gathering NIC info for cluster: {cluster_name}")
-    nic_data      = get_isilon_nics(cluster_name)
-
-    print(f"[DEBUG] Gathering quota usage for cluster: {cluster_name}")
-    quota_out = get_quota_usage_report(cluster_name)
-    quota_json = "\n".join(quota_out) if quota_out else "[]"
-    quota_table_html = generate_quota_html_table(quota_json)
-
-    print(f"[DEBUG] Gathering NFS for cluster: {cluster_name}")
-    nfs_out = get_isilon_nfs_report(cluster_name)
-    nfs_json_str = "\n".join(nfs_out) if nfs_out else "[]"
-    nfs_table_html = generate_nfs_html_table(nfs_json_str)
-
-    print(f"[DEBUG] Gathering SMB for cluster: {cluster_name}")
-    smb_out = get_isilon_smb_report(cluster_name)
-    smb_json_str = "\n".join(smb_out) if smb_out else "[]"
-    smb_table_html = generate_smb_html_table(smb_json_str)
-
-    print(f"[DEBUG] Gathering audit rate for cluster: {cluster_name}")
-    audit_out = run_isilon_audit_rate(cluster_name)
-    if not audit_out:
-        audit_panel = "<pre>No audit rate output.</pre>"
-    else:
-        audit_panel = "<pre>" + "\n".join(audit_out) + "</pre>"
+    `on_result(cluster_name, key, value)` is called as soon as each collector
+    finishes (used by --lazy-load to publish panels incrementally).
+
+    If a collector fails because the connection itself went down, the collectors
+    that have not started yet are cancelled instead of each trying (and timing
+    out) on the dead transport.
+    """
+    collectors = {
+        "time_ntp": get_isilon_time_and_ntp,
+        "status":   get_isilon_status,
+        "battery":  get_isilon_battery_status,
+        "rw":       get_isilon_read_write_status,
+        "disk":     get_isilon_disk_usage,
+        "nic":      get_isilon_nics,
+        "quota":    get_quota_usage_report,
+        "nfs":      get_isilon_nfs_report,
+        "smb":      get_isilon_smb_report,
+        "audit":    run_isilon_audit_rate,
+    }
+
+    pool = get_ssh_pool(cluster_name)
+    connection_lost = threading.Event()
+
+    def run_collector(fn):
+        # Queued collectors skip the SSH round trip once the connection is known dead
+        if connection_lost.is_set():
+            raise ValueError(f"SSH connection to {cluster_name} was lost")
+        return fn(cluster_name)
 
-    html = build_single_cluster_html(
+    results = {}
+    with ThreadPoolExecutor(max_workers=SSH_MAX_SESSIONS + 1) as executor:
+        futures = {executor.submit(run_collector, fn): key for key, fn in collectors.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                value = future.result()
+            except CancelledError:
+                value = [f"ERROR: SSH connection to {cluster_name} was lost"]
+            except Exception as ex:
+                logger.warning("Collector '%s' failed for cluster %s: %s", key, cluster_name, ex)
+                value = [f"ERROR: {ex}"]
+            else:
+                logger.debug("Collector '%s' finished for cluster: %s", key, cluster_name)
+            # Checked after every collector: a cached one "succeeds" with stale data
+            # even when the connection is gone
+            if pool and not connection_lost.is_set() and not pool.is_active():
+                logger.warning("SSH connection to %s is down, cancelling the remaining collectors", cluster_name)
+                connection_lost.set()
+                for pending in futures:
+                    pending.cancel()
+            if key == "time_ntp" and not isinstance(value, dict):
+                value = {"cluster_time": value, "ntp_info": []}
+            results[key] = value
+            if on_result:
+                on_result(cluster_name, key, value)
+    return results
+
+def _single_cluster_args(cluster_name: str, data: Dict[str, object]) -> tuple:
+    """
+    Arguments of iter_single_cluster_html / iter_single_cluster_body for the
+    output of collect_cluster_data().
+    """
+    cluster_time_lines = data["time_ntp"]["cluster_time"]
+    ntp_lines = data["time_ntp"]["ntp_info"]
+
+    status_data   = data["status"]
+    battery_data  = data["battery"]
+    rw_data       = data["rw"]
+    disk_data     = data["disk"]
+    nic_data      = data["nic"]
+
+    quota_table_html = generate_quota_html_table(json_text(data["quota"]))
+
+    nfs_table_html = generate_nfs_html_table(json_text(data["nfs"]))
+
+    smb_table_html = generate_smb_html_table(json_text(data["smb"]))
+
+    return (
         cluster_name, cluster_time_lines, ntp_lines,
         status_data, battery_data, rw_data, disk_data, nic_data,
-        quota_table_html, nfs_table_html, smb_table_html, audit_panel
+        quota_table_html, nfs_table_html, smb_table_html, data["audit"]
     )
 
-    os.makedirs(os.path.dirname(HTML_REPORT), exist_ok=True)
-    with open(HTML_REPORT, "w", encoding="utf-8") as f:
-        f.write(html)
+def iter_cluster_html(cluster_name: str, data: Dict[str, object]) -> Iterator[str]:
+    """
+    Turn the output of collect_cluster_data() into the single-cluster HTML page,
+    yielded section by section.
+    """
+    return iter_single_cluster_html(*_single_cluster_args(cluster_name, data))
+
+def cluster_html_fragments(cluster_name: str, data: Dict[str, object]) -> List[str]:
+    """
+    Body fragments of the single-cluster page, for nesting in the combined report.
+    """
+    return build_single_cluster_html_fragments(*_single_cluster_args(cluster_name, data))
+
+# Dashboard panels in page order: (collect_cluster_data key, panel key, title)
+LAZY_PANELS = [
+    ("time_ntp", "Time",    "Cluster Time & NTP"),
+    ("status",   "Status",  "Cluster Status"),
+    ("battery",  "Battery", "Battery Status"),
+    ("rw",       "RW",      "Read/Write Status"),
+    ("disk",     "Disk",    "Disk Usage"),
+    ("nic",      "NIC",     "NIC Info"),
+    ("quota",    "Quota",   "Quota Usage Report"),
+    ("nfs",      "NFS",     "NFS Configuration Report"),
+    ("smb",      "SMB",     "SMB Configuration Report"),
+    ("audit",    "Audit",   "Audit Rate"),
+]
+_LAZY_PANEL_KEYS = {collector: key for collector, key, _title in LAZY_PANELS}
+_LAZY_MANIFEST_LOCK = threading.Lock()
+
+def dump_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def lazy_panel_payload(collector_key: str, value) -> Dict[str, object]:
+    if collector_key == "time_ntp":
+        return {"html": time_ntp_body(value["cluster_time"], value["ntp_info"])}
+    if collector_key == "quota":
+        return {"html": generate_quota_html_table(json_text(value))}
+    if collector_key == "nfs":
+        return {"html": generate_nfs_html_table(json_text(value))}
+    if collector_key == "smb":
+        return {"html": generate_smb_html_table(json_text(value))}
+    if collector_key == "audit":
+        return {"lines": value, "empty": "No audit rate output."}
+    return {"lines": value}
+
+def _lazy_data_dir(report_path: str) -> str:
+    return os.path.splitext(report_path)[0] + "_data"
+
+def _lazy_src(data_dir: str, cluster_name: str, panel_key: str) -> str:
+    # URL of a panel's JSON, relative to the report
+    return f"{quote(os.path.basename(data_dir))}/{safe_cluster_id(cluster_name)}/{panel_key.lower()}.json"
+
+def iter_lazy_panels(cluster_name: str, data_dir: str) -> Iterator[str]:
+    cluster_id = safe_cluster_id(cluster_name)
+    for idx, (_collector, key, title) in enumerate(LAZY_PANELS):
+        body = f'<div data-src="{_lazy_src(data_dir, cluster_name, key)}">Waiting for data...</div>'
+        yield accordion_section(cluster_id, key, title, body, expanded=(idx == 0))
+
+def write_lazy_shell(report_path: str, cluster_names: List[str]) -> str:
+    """
+    --lazy-load: write `report_path` as a small page shell before any data is
+    collected. Panels are filled in by the browser as write_lazy_panel() drops
+    their JSON into the sibling '<report>_data' folder and lists them in its
+    manifest.jsonl. Returns the data folder.
+    """
+    data_dir = _lazy_data_dir(report_path)
+    # Every cluster folder up front, so write_lazy_panel() doesn't stat per panel
+    for c_name in cluster_names:
+        os.makedirs(os.path.join(data_dir, safe_cluster_id(c_name)), exist_ok=True)
+    manifest_url = quote(os.path.basename(data_dir)) + "/manifest.jsonl"
+    with open(os.path.join(data_dir, "manifest.jsonl"), "wb"):
+        pass
+
+    if len(cluster_names) == 1:
+        title = f"Isilon Dashboard - {cluster_names[0]}"
+        heading = f"Daily Isilon Overview for {cluster_names[0]}"
+    else:
+        title = "Isilon Multi-Cluster Dashboard"
+        heading = "Multi-Cluster Combined Overview"
+
+    sections = [f"""<html>
+<head>
+<title>{title}</title>
+{BOOTSTRAP_CSS}
+</head>
+<body class='bg-light' data-manifest="{manifest_url}">
 
-    print(f"Modern HTML Dashboard saved to: {HTML_REPORT}")
+<nav class="navbar navbar-expand-lg navbar-dark bg-primary">
+  <div class="container-fluid">
+    <a class="navbar-brand" href="#">{title}</a>
+    <button id="preloadAll" class="btn btn-light btn-sm" type="button">Preload all</button>
+  </div>
+</nav>
+
+<div class='container mt-4'>
+<h1 class='mb-3'>{heading}</h1>
+"""]
+    if len(cluster_names) == 1:
+        sections.append("<div class='accordion' id='accordionExample'>")
+        sections.extend(iter_lazy_panels(cluster_names[0], data_dir))
+        sections.append("</div>")
+    else:
+        sections.append("<div class='accordion' id='MultiClusterAccordion'>")
+        for idx, c_name in enumerate(cluster_names, start=1):
+            sections.append(f"""
+<div class="accordion-item">
+  <h2 class="accordion-header" id="headingMulti_{idx}">
+    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseMulti_{idx}" aria-expanded="false" aria-controls="collapseMulti_{idx}">
+      Cluster: {c_name}
+    </button>
+  </h2>
+  <div id="collapseMulti_{idx}" class="accordion-collapse collapse" aria-labelledby="headingMulti_{idx}" data-bs-parent="#MultiClusterAccordion">
+    <div class="accordion-body">
+<div class='accordion' id='accordionExample'>""")
+            sections.extend(iter_lazy_panels(c_name, data_dir))
+            sections.append("</div>\n</div></div></div>")
+        sections.append("</div>")
+    sections.append("</div>\n")
+    sections.append(BOOTSTRAP_JS)
+    sections.append(LAZY_LOADER_JS)
+    sections.append("</body></html>\n")
+
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("".join(sections))
+    return data_dir
+
+def write_lazy_panel(data_dir: str, cluster_name: str, collector_key: str, value) -> None:
+    """
+    Write one finished collector's panel JSON and announce it in manifest.jsonl.
+    Safe to call from several cluster threads at once.
+    """
+    panel_key = _LAZY_PANEL_KEYS[collector_key]
+    path = os.path.join(data_dir, safe_cluster_id(cluster_name), f"{panel_key.lower()}.json")
+    # Write then rename, so the browser never fetches a half-written file
+    with open(path + ".tmp", "wb") as f:
+        f.write(dump_json(lazy_panel_payload(collector_key, value)))
+    os.replace(path + ".tmp", path)
+
+    entry = dump_json({"src": _lazy_src(data_dir, cluster_name, panel_key)}) + b"\n"
+    with _LAZY_MANIFEST_LOCK:
+        with open(os.path.join(data_dir, "manifest.jsonl"), "ab") as f:
+            f.write(entry)
+
+def finish_lazy_manifest(data_dir: str) -> None:
+    """
+    Tell the page that no more panels are coming (it stops polling).
+    """
+    with _LAZY_MANIFEST_LOCK:
+        with open(os.path.join(data_dir, "manifest.jsonl"), "ab") as f:
+            f.write(dump_json({"done": True}) + b"\n")
+
+def write_report(path: str, chunks: Iterable[str]) -> str:
+    """
+    Write the report chunks to `path`. With COMPRESS_REPORT the chunks are
+    streamed through brotli ('.br', when installed) or gzip ('.gz') instead.
+    Returns the path of the file actually written (REPORT_FOLDER is created by main()).
+    """
+    if not COMPRESS_REPORT:
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(chunks)
+        return path
+
+    if brotli is not None:
+        path += ".br"
+        compressor = brotli.Compressor(quality=6)
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(compressor.process(chunk.encode("utf-8")))
+            f.write(compressor.finish())
+        return path
+
+    path += ".gz"
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+        f.writelines(chunks)
+    return path
+
+def create_html_dashboard(cluster_name: str):
+    if not get_ssh_pool(cluster_name):
+        print("No SSH session. Please connect first.")
+        return
+
+    upload_audit_rate_script(cluster_name)
+
+    if LAZY_LOAD:
+        # Shell first; each panel appears in the page as soon as its collector is done
+        data_dir = write_lazy_shell(HTML_REPORT, [cluster_name])
+        print(f"Lazy-load HTML Dashboard saved to: {HTML_REPORT}")
+        logger.debug("Gathering dashboard data in parallel for cluster: %s", cluster_name)
+        collect_cluster_data(cluster_name, on_result=functools.partial(write_lazy_panel, data_dir))
+        finish_lazy_manifest(data_dir)
+        print(f"Panel data saved to: {data_dir}")
+        print("Serve the report folder over HTTP (e.g. 'python -m http.server') to view it;"
+              " the emailed copy would contain the page shell only, so email is skipped.")
+        return
+
+    logger.debug("Gathering dashboard data in parallel for cluster: %s", cluster_name)
+    data = collect_cluster_data(cluster_name)
+
+    report_file = write_report(HTML_REPORT, iter_cluster_html(cluster_name, data))
+
+    print(f"Modern HTML Dashboard saved to: {report_file}")
 
     choice = input("Send this HTML via email? (y/n): ").strip().lower()
     if choice.startswith("y"):
-        send_html_via_email(HTML_REPORT)
+        send_html_via_email(report_file)
         print("Email sent (if no exceptions).")
 
-def build_single_cluster_html(
+def iter_single_cluster_body(
     cluster_name: str,
     cluster_time_lines: List[str],
     ntp_lines: List[str],
@@ -648,332 +1392,214 @@ def build_single_cluster_html(
     quota_table_html: str,
     nfs_table_html: str,
     smb_table_html: str,
-    audit_panel: str
-) -> str:
+    audit_lines: List[str]
+) -> Iterator[str]:
+    """
+    Yields what goes inside <body> of the single-cluster page (navbar and accordion)
+    one section at a time, without the <html>/<head> shell or the Bootstrap JS.
+    """
     cluster_id = safe_cluster_id(cluster_name)
 
-    html_lines = []
-    html_lines.append("<html>")
-    html_lines.append("<head>")
-    html_lines.append(f"<title>Isilon Dashboard ({cluster_name})</title>")
-    html_lines.append(BOOTSTRAP_CSS)
-    html_lines.append("</head>")
-    html_lines.append("<body class='bg-light'>")
-
-    html_lines.append(f"""
+    yield f"""
 <nav class="navbar navbar-expand-lg navbar-dark bg-primary">
   <div class="container-fluid">
     <a class="navbar-brand" href="#">Isilon Dashboard - {cluster_name}</a>
   </div>
 </nav>
-""")
-
-    html_lines.append("<div class='container mt-4'>")
-    html_lines.append(f"<h1 class='mb-3'>Daily Isilon Overview for {cluster_name}</h1>")
-
-    # Use cluster_id in all IDs
-    html_lines.append("<div class='accordion' id='accordionExample'>")
 
-    # Time & NTP
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingTime_{cluster_id}">
-    <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#collapseTime_{cluster_id}" aria-expanded="true" aria-controls="collapseTime_{cluster_id}">
-      Cluster Time & NTP
-    </button>
-  </h2>
-  <div id="collapseTime_{cluster_id}" class="accordion-collapse collapse show" aria-labelledby="headingTime_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-      <h5>Cluster Time (isi_for_array -s date)</h5>
-      <pre>""")
-    if cluster_time_lines:
-        for ln in cluster_time_lines:
-            html_lines.append(ln)
-    else:
-        html_lines.append("No cluster time data.")
-    html_lines.append("</pre>")
-
-    html_lines.append("<h5>NTP Servers (isi ntp servers list)</h5><pre>")
-    if ntp_lines:
-        for ln in ntp_lines:
-            html_lines.append(ln)
-    else:
-        html_lines.append("No NTP data.")
-    html_lines.append("</pre></div></div></div>")
-
-    # Status
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingStatus_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseStatus_{cluster_id}" aria-expanded="false" aria-controls="collapseStatus_{cluster_id}">
-      Cluster Status
-    </button>
-  </h2>
-  <div id="collapseStatus_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingStatus_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-      <pre>""")
-    for ln in status_data:
-        html_lines.append(ln)
-    html_lines.append("</pre></div></div></div>")
-
-    # Battery
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingBattery_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseBattery_{cluster_id}" aria-expanded="false" aria-controls="collapseBattery_{cluster_id}">
-      Battery Status
-    </button>
-  </h2>
-  <div id="collapseBattery_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingBattery_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-      <pre>""")
-    for ln in battery_data:
-        html_lines.append(ln)
-    html_lines.append("</pre></div></div></div>")
-
-    # RW
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingRW_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseRW_{cluster_id}" aria-expanded="false" aria-controls="collapseRW_{cluster_id}">
-      Read/Write Status
-    </button>
-  </h2>
-  <div id="collapseRW_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingRW_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-      <pre>""")
-    for ln in rw_data:
-        html_lines.append(ln)
-    html_lines.append("</pre></div></div></div>")
-
-    # Disk usage
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingDisk_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseDisk_{cluster_id}" aria-expanded="false" aria-controls="collapseDisk_{cluster_id}">
-      Disk Usage
-    </button>
-  </h2>
-  <div id="collapseDisk_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingDisk_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-      <pre>""")
-    for ln in disk_data:
-        html_lines.append(ln)
-    html_lines.append("</pre></div></div></div>")
-
-    # NIC usage
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingNIC_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseNIC_{cluster_id}" aria-expanded="false" aria-controls="collapseNIC_{cluster_id}">
-      NIC Info
-    </button>
-  </h2>
-  <div id="collapseNIC_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingNIC_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-      <pre>""")
-    for ln in nic_data:
-        html_lines.append(ln)
-    html_lines.append("</pre></div></div></div>")
+<div class='container mt-4'>
+<h1 class='mb-3'>Daily Isilon Overview for {cluster_name}</h1>
+<div class='accordion' id='accordionExample'>
+"""
 
-    # Quota
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingQuota_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseQuota_{cluster_id}" aria-expanded="false" aria-controls="collapseQuota_{cluster_id}">
-      Quota Usage Report
-    </button>
-  </h2>
-  <div id="collapseQuota_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingQuota_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-    """)
-    html_lines.append(quota_table_html)
-    html_lines.append("</div></div></div>")
+    lines = []
+    time_body = time_ntp_body(cluster_time_lines, ntp_lines)
+    _emit_panel(lines, "Time", cluster_id, "Cluster Time & NTP", time_body, expanded=True)
+    _emit_panel(lines, "Status", cluster_id, "Cluster Status", pre_block(status_data))
+    _emit_panel(lines, "Battery", cluster_id, "Battery Status", pre_block(battery_data))
+    _emit_panel(lines, "RW", cluster_id, "Read/Write Status", pre_block(rw_data))
+    _emit_panel(lines, "Disk", cluster_id, "Disk Usage", pre_block(disk_data))
+    _emit_panel(lines, "NIC", cluster_id, "NIC Info", pre_block(nic_data))
+    _emit_panel(lines, "Quota", cluster_id, "Quota Usage Report", quota_table_html)
+    _emit_panel(lines, "NFS", cluster_id, "NFS Configuration Report", nfs_table_html)
+    _emit_panel(lines, "SMB", cluster_id, "SMB Configuration Report", smb_table_html)
+    _emit_panel(lines, "Audit", cluster_id, "Audit Rate", pre_block(audit_lines, "No audit rate output."))
+    # One string for the panels, never _emit_panel's bare pieces: the ids are split
+    # across those, so nothing may be inserted between them
+    yield "".join(lines)
+
+    yield "\n</div>\n</div>\n"  # close .accordion and .container
+
+def iter_single_cluster_html(cluster_name: str, *panel_args, include_shell: bool = True) -> Iterator[str]:
+    """
+    Yields the single-cluster page one section at a time, so it can be written
+    straight to disk without holding the whole document in memory.
+    Takes the same arguments as iter_single_cluster_body. With include_shell=False
+    the <html>/<head> wrapper, BOOTSTRAP_CSS and BOOTSTRAP_JS are left out (the
+    combined report emits those once for all clusters).
+    """
+    if not include_shell:
+        yield from iter_single_cluster_body(cluster_name, *panel_args)
+        return
 
-    # NFS
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingNFS_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseNFS_{cluster_id}" aria-expanded="false" aria-controls="collapseNFS_{cluster_id}">
-      NFS Configuration Report
-    </button>
-  </h2>
-  <div id="collapseNFS_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingNFS_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-    """)
-    html_lines.append(nfs_table_html)
-    html_lines.append("</div></div></div>")
+    yield f"""<html>
+<head>
+<title>Isilon Dashboard ({cluster_name})</title>
+{BOOTSTRAP_CSS}
+</head>
+<body class='bg-light'>
+"""
+    yield from iter_single_cluster_body(cluster_name, *panel_args)
+    yield BOOTSTRAP_JS
+    yield "</body></html>\n"
 
-    # SMB
-    html_lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingSMB_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseSMB_{cluster_id}" aria-expanded="false" aria-controls="collapseSMB_{cluster_id}">
-      SMB Configuration Report
-    </button>
-  </h2>
-  <div id="collapseSMB_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingSMB_{cluster_id}" data-bs-parent="#accordionExample">
-    <div class="accordion-body">
-    """)
-    html_lines.append(smb_table_html)
-    html_lines.append("</div></div></div>")
+def build_single_cluster_html_fragments(*args) -> List[str]:
+    """
+    Body of the single-cluster page as a list of fragments, without the shell,
+    ready to be extended into the combined report.
+    """
+    return list(iter_single_cluster_html(*args, include_shell=False))
 
-    # Audit
-    html_lines.append(f"""
+# Head of one cluster's item in the combined report; {IDX} and {NAME} are filled in
+# with str.replace (the index appears five times)
+_MULTI_ITEM_TMPL = """
 <div class="accordion-item">
-  <h2 class="accordion-header" id="headingAudit_{cluster_id}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseAudit_{cluster_id}" aria-expanded="false" aria-controls="collapseAudit_{cluster_id}">
-      Audit Rate
+  <h2 class="accordion-header" id="headingMulti_{IDX}">
+    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseMulti_{IDX}" aria-expanded="false" aria-controls="collapseMulti_{IDX}">
+      Cluster: {NAME}
     </button>
   </h2>
-  <div id="collapseAudit_{cluster_id}" class="accordion-collapse collapse" aria-labelledby="headingAudit_{cluster_id}" data-bs-parent="#accordionExample">
+  <div id="collapseMulti_{IDX}" class="accordion-collapse collapse" aria-labelledby="headingMulti_{IDX}" data-bs-parent="#MultiClusterAccordion">
     <div class="accordion-body">
-    """)
-    html_lines.append(audit_panel)
-    html_lines.append("</div></div></div>")
-
-    html_lines.append("</div>")  # close .accordion
-    html_lines.append("</div>")  # close .container
-    html_lines.append(BOOTSTRAP_JS)
-    html_lines.append("</body></html>")
-
-    return "\n".join(html_lines)
+"""
 
-def build_multi_cluster_html(cluster_results: Dict[str, Dict[str, str]]) -> str:
-    lines = []
-    lines.append("<html><head>")
-    lines.append("<title>Multi-Cluster Isilon Dashboard</title>")
-    lines.append(BOOTSTRAP_CSS)
-    lines.append("</head><body class='bg-light'>")
+def iter_multi_cluster_html(cluster_results: Dict[str, Dict[str, List[str]]]) -> Iterator[str]:
+    """
+    Yields the combined report piece by piece (each cluster's body fragments as
+    they are), so write_report() can stream it without one big joined string.
+    """
+    yield "<html><head>\n"
+    yield "<title>Multi-Cluster Isilon Dashboard</title>\n"
+    yield BOOTSTRAP_CSS
+    yield "\n</head><body class='bg-light'>\n"
 
-    lines.append("""
+    yield """
 <nav class="navbar navbar-expand-lg navbar-dark bg-primary">
   <div class="container-fluid">
     <a class="navbar-brand" href="#">Isilon Multi-Cluster Dashboard</a>
   </div>
 </nav>
-""")
+"""
 
-    lines.append("<div class='container mt-4'>")
-    lines.append("<h1>Multi-Cluster Combined Overview</h1>")
+    yield "<div class='container mt-4'>\n"
+    yield "<h1>Multi-Cluster Combined Overview</h1>\n"
 
-    lines.append("<div class='accordion' id='MultiClusterAccordion'>")
+    yield "<div class='accordion' id='MultiClusterAccordion'>\n"
 
-    idx = 0
-    for c_name, c_data in cluster_results.items():
-        idx += 1
-        c_html = c_data['html']
+    for idx, (c_name, c_data) in enumerate(cluster_results.items(), 1):
+        yield _MULTI_ITEM_TMPL.replace("{IDX}", str(idx)).replace("{NAME}", c_name)
 
-        lines.append(f"""
-<div class="accordion-item">
-  <h2 class="accordion-header" id="headingMulti_{idx}">
-    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapseMulti_{idx}" aria-expanded="false" aria-controls="collapseMulti_{idx}">
-      Cluster: {c_name}
-    </button>
-  </h2>
-  <div id="collapseMulti_{idx}" class="accordion-collapse collapse" aria-labelledby="headingMulti_{idx}" data-bs-parent="#MultiClusterAccordion">
-    <div class="accordion-body">
-""")
+        yield from c_data['fragments']
+        yield "\n</div></div></div>\n"
 
-        body_only = c_html
-        body_only = re.sub(r"(?is)<html.*?>", "", body_only)
-        body_only = re.sub(r"(?is)</html>", "", body_only)
-        body_only = re.sub(r"(?is)<head.*?>.*?</head>", "", body_only)
-        body_only = re.sub(r"(?is)<body.*?>", "", body_only)
-        body_only = re.sub(r"(?is)</body>", "", body_only)
+    yield "</div>\n"  # MultiClusterAccordion
+    yield "</div>\n"  # container
+    yield BOOTSTRAP_JS
+    yield "\n</body></html>\n"
 
-        lines.append(body_only)
-        lines.append("</div></div></div>")
+def collect_cluster(
+    c_ip: str,
+    c_user: str,
+    c_pass: str,
+    on_result: Optional[Callable[[str, str, object], None]] = None
+) -> Optional[List[str]]:
+    """
+    Connect to one cluster, gather its dashboard data and return the body
+    fragments of its single-cluster HTML (None if the connection failed). Each cluster gets its
+    own SSH connection, so several of these can run at the same time.
 
-    lines.append("</div>")  # MultiClusterAccordion
-    lines.append("</div>")  # container
-    lines.append(BOOTSTRAP_JS)
-    lines.append("</body></html>")
-    return "\n".join(lines)
+    With `on_result` (--lazy-load) every section is handed over as soon as it is
+    collected and no HTML is built; the return value is then None.
+    """
+    logger.debug("Connecting to cluster %s ...", c_ip)
+    connect_res = connect_isilon_cluster(c_ip, c_user, c_pass)
+    if not print_connect_result(connect_res):
+        print(f"Skipping {c_ip} due to connection error.")
+        return None
 
-def handle_multiple_clusters_mode(num_clusters: int):
-    cluster_results = {}
+    try:
+        logger.debug("Uploading script to cluster %s ...", c_ip)
+        upload_audit_rate_script(c_ip)
+
+        logger.debug("Gathering data for cluster %s ...", c_ip)
+        data = collect_cluster_data(c_ip, on_result=on_result)
+        if on_result:
+            return None
+
+        logger.debug("Building single cluster HTML for %s", c_ip)
+        return cluster_html_fragments(c_ip, data)
+    finally:
+        logger.debug("Disconnecting from %s", c_ip)
+        disc = disconnect_isilon_cluster(c_ip)
+        print("\n".join(disc))
 
+def handle_multiple_clusters_mode(num_clusters: int):
+    # Ask for every cluster's credentials first (input/getpass stay on the main thread)
+    clusters = []
     for i in range(num_clusters):
         print(f"\n=== Cluster {i+1} of {num_clusters} ===")
         c_ip = input("Enter the Isilon cluster IP/Hostname: ").strip()
         c_user = input("Enter your username: ").strip()
         c_pass = getpass.getpass("Enter your password: ")
+        clusters.append((c_ip, c_user, c_pass))
 
-        print(f"[DEBUG] Connecting to cluster {c_ip} ...")
-        connect_res = connect_isilon_cluster(c_ip, c_user, c_pass)
-        for line in connect_res:
-            print(line)
-        if any("ERROR" in x for x in connect_res):
-            print(f"Skipping {c_ip} due to connection error.")
-            continue
-
-        print(f"[DEBUG] Uploading script to cluster {c_ip} ...")
-        upload_audit_rate_script()
-
-        print(f"[DEBUG] Gathering data for cluster {c_ip} ...")
-        time_data = get_isilon_time_and_ntp(c_ip)
-        cluster_time_lines = time_data["cluster_time"]
-        ntp_lines = time_data["ntp_info"]
-
-        print(f"[DEBUG] get_isilon_status for {c_ip}")
-        status_data   = get_isilon_status(c_ip)
-        print(f"[DEBUG] get_isilon_battery_status for {c_ip}")
-        battery_data  = get_isilon_battery_status(c_ip)
-        print(f"[DEBUG] get_isilon_read_write_status for {c_ip}")
-        rw_data       = get_isilon_read_write_status(c_ip)
-        print(f"[DEBUG] get_isilon_disk_usage for {c_ip}")
-        disk_data     = get_isilon_disk_usage(c_ip)
-        print(f"[DEBUG] get_isilon_nics for {c_ip}")
-        nic_data      = get_isilon_nics(c_ip)
-
-        print(f"[DEBUG] get_quota_usage_report for {c_ip}")
-        quota_out = get_quota_usage_report(c_ip)
-        quota_json = "\n".join(quota_out) if quota_out else "[]"
-        quota_table_html = generate_quota_html_table(quota_json)
-
-        print(f"[DEBUG] get_isilon_nfs_report for {c_ip}")
-        nfs_out = get_isilon_nfs_report(c_ip)
-        nfs_json_str = "\n".join(nfs_out) if nfs_out else "[]"
-        nfs_table_html = generate_nfs_html_table(nfs_json_str)
-
-        print(f"[DEBUG] get_isilon_smb_report for {c_ip}")
-        smb_out = get_isilon_smb_report(c_ip)
-        smb_json_str = "\n".join(smb_out) if smb_out else "[]"
-        smb_table_html = generate_smb_html_table(smb_json_str)
-
-        print(f"[DEBUG] run_isilon_audit_rate for {c_ip}")
-        out_audit = run_isilon_audit_rate(c_ip)
-        if not out_audit:
-            audit_panel = "<pre>No audit rate output.</pre>"
-        else:
-            audit_panel = "<pre>" + "\n".join(out_audit) + "</pre>"
-
-        print(f"[DEBUG] Building single cluster HTML for {c_ip}")
-        single_html = build_single_cluster_html(
-            c_ip, cluster_time_lines, ntp_lines,
-            status_data, battery_data, rw_data, disk_data, nic_data,
-            quota_table_html, nfs_table_html, smb_table_html, audit_panel
-        )
-
-        cluster_results[c_ip] = {'html': single_html}
+    multi_report_file = os.path.join(REPORT_FOLDER, f"{timestamp_str} - MultiCluster_IsilonDashboard.html")
+    on_result = None
+    if LAZY_LOAD:
+        # Shell first; a slow cluster doesn't hold back the panels of the others
+        data_dir = write_lazy_shell(multi_report_file, [c_ip for c_ip, _, _ in clusters])
+        print(f"\nLazy-load Multi-Cluster HTML Dashboard saved to: {multi_report_file}")
+        on_result = functools.partial(write_lazy_panel, data_dir)
+
+    # Then collect the clusters concurrently, a few at a time; every cluster already
+    # runs up to SSH_MAX_SESSIONS + 1 collector threads of its own
+    workers = min(len(clusters), MULTI_CLUSTER_WORKERS)
+    logger.debug("Collecting %d clusters, %d at a time ...", len(clusters), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (c_ip, executor.submit(collect_cluster, c_ip, c_user, c_pass, on_result))
+            for c_ip, c_user, c_pass in clusters
+        ]
+
+    if LAZY_LOAD:
+        for c_ip, future in futures:
+            try:
+                future.result()
+            except Exception as ex:
+                print(f"Cluster {c_ip} failed: {ex}")
+        finish_lazy_manifest(data_dir)
+        print(f"Panel data saved to: {data_dir}")
+        print("Serve the report folder over HTTP (e.g. 'python -m http.server') to view it;"
+              " the emailed copy would contain the page shell only, so email is skipped.")
+        return
 
-        print(f"[DEBUG] Disconnecting from {c_ip}")
-        disc = disconnect_isilon_cluster(c_ip)
-        print("\n".join(disc))
+    cluster_results = {}
+    for c_ip, future in futures:
+        try:
+            fragments = future.result()
+        except Exception as ex:
+            print(f"Skipping {c_ip}: {ex}")
+            continue
+        if fragments:
+            cluster_results[c_ip] = {'fragments': fragments}
 
     if not cluster_results:
         print("No successful clusters connected. Exiting multi-cluster mode.")
         return
 
-    # Build combined HTML
-    print("[DEBUG] Building combined multi-cluster HTML...")
-    combined_html = build_multi_cluster_html(cluster_results)
-
-    multi_report_file = os.path.join(REPORT_FOLDER, f"{timestamp_str} - MultiCluster_IsilonDashboard.html")
-    os.makedirs(os.path.dirname(multi_report_file), exist_ok=True)
-    with open(multi_report_file, "w", encoding="utf-8") as f:
-        f.write(combined_html)
+    # Stream the combined HTML to disk
+    logger.debug("Writing combined multi-cluster HTML...")
+    multi_report_file = write_report(multi_report_file, iter_multi_cluster_html(cluster_results))
 
     print(f"\nMulti-Cluster HTML Dashboard saved to: {multi_report_file}")
 
@@ -982,21 +1608,68 @@ def handle_multiple_clusters_mode(num_clusters: int):
         send_html_via_email(multi_report_file)
         print("Email sent (if no exceptions).")
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Isilon (OneFS) CLI menu and HTML dashboard")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Do not serve cached command output; always query the cluster"
+    )
+    parser.add_argument(
+        "--lazy-load", action="store_true",
+        help="Write the dashboard as a small HTML shell plus per-panel JSON files that appear "
+             "as each command finishes (serve the report folder over HTTP to view)"
+    )
+    parser.add_argument(
+        "--compress", action="store_true",
+        help="Write (and email) the report compressed: .br if brotli is installed, .gz otherwise"
+    )
+    parser.add_argument(
+        "--refresh-cluster-info", action="store_true",
+        help="Re-read cached cluster identity/version (normally kept for 24 hours)"
+    )
+    return parser.parse_args()
+
+def _setup_logging() -> None:
+    """
+    Send the "onefs" logger to stdout as "[LEVEL] message", at the level named by
+    $ONEFS_LOG (default DEBUG). Only this logger is configured: the root logger is
+    left alone, so paramiko's own transport/sftp logging stays silent.
+    """
+    level = logging.getLevelName(os.environ.get("ONEFS_LOG", "DEBUG").strip().upper())
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level if isinstance(level, int) else logging.DEBUG)
+    logger.propagate = False
+
 def main():
+    global CACHE_ENABLED, LAZY_LOAD, COMPRESS_REPORT
+    args = parse_args()
+    # Same "[DEBUG] ..." lines on stdout as before; ONEFS_LOG=INFO (or WARNING) quiets them
+    _setup_logging()
+    if args.no_cache:
+        CACHE_ENABLED = False
+    LAZY_LOAD = args.lazy_load
+    COMPRESS_REPORT = args.compress
+    if args.refresh_cluster_info:
+        CACHE_REFRESH_GROUPS.add("cluster_info")
+    os.makedirs(REPORT_FOLDER, exist_ok=True)
+
     print("\n=== ENHANCED ISILON SCRIPT (with Time/NTP, Quota, JSON parsing, AuditRate,"
           " auto-upload, Multi-Cluster, Timeouts, and Debug Prints) ===")
 
     multi_answer = input("Do you want to monitor multiple clusters? (y/n): ").strip().lower()
     if multi_answer.startswith("y"):
         while True:
-            try:
-                num_clusters = int(input("How many clusters do you want to monitor? Enter a number: ").strip())
-                if num_clusters < 2:
-                    print("Please enter at least 2 if you want multiple. Or press Ctrl+C to exit.")
-                    continue
-                break
-            except ValueError:
+            answer = input("How many clusters do you want to monitor? Enter a number: ").strip()
+            if not answer.isdecimal():
                 print("Invalid number. Please try again.")
+                continue
+            num_clusters = int(answer)
+            if num_clusters < 2:
+                print("Please enter at least 2 if you want multiple. Or press Ctrl+C to exit.")
+                continue
+            break
         handle_multiple_clusters_mode(num_clusters)
     else:
         cluster_ip = input("Enter the Isilon cluster IP/Hostname: ").strip()
@@ -1004,10 +1677,7 @@ def main():
         password   = getpass.getpass("Enter your password: ")
 
         connect_result = connect_isilon_cluster(cluster_ip, user_name, password)
-        for line in connect_result:
-            print(line)
-
-        if any("ERROR" in x for x in connect_result):
+        if not print_connect_result(connect_result):
             return
 
         menu_loop(cluster_ip)
@@ -1017,28 +1687,24 @@ def send_html_via_email(filepath: str):
     if not os.path.isfile(filepath):
         print("HTML file not found for emailing.")
         return
-    with open(filepath, "r", encoding="utf-8") as f:
-        html_data = f.read()
 
-    msg = MIMEMultipart("alternative")
+    # Read the report once; the same bytes feed the inline copy and the attachment
+    with open(filepath, "rb") as f:
+        data = f.read()
+    filename = os.path.basename(filepath)
+
+    msg = EmailMessage()
     msg["Subject"] = MAIL_SUBJECT
     msg["From"] = MAIL_FROM
     msg["To"] = MAIL_TO
     if MAIL_CC:
         msg["CC"] = MAIL_CC
 
-    part_html = MIMEText(html_data, "html")
-    msg.attach(part_html)
-
-    with open(filepath, "rb") as af:
-        part_file = MIMEBase("application", "octet-stream")
-        part_file.set_payload(af.read())
-    encoders.encode_base64(part_file)
-    part_file.add_header(
-        "Content-Disposition",
-        f'attachment; filename="{os.path.basename(filepath)}"'
-    )
-    msg.attach(part_file)
+    msg.set_content(f"The Isilon dashboard is attached as {filename}.")
+    if not filepath.endswith((".gz", ".br")):
+        # Inline copy, except for a compressed report (--compress)
+        msg.add_alternative(data.decode("utf-8"), subtype="html")
+    msg.add_attachment(data, maintype="application", subtype="octet-stream", filename=filename)
 
     try:
         with smtplib.SMTP(MAIL_SERVER, MAIL_PORT) as server: